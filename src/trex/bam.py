@@ -8,11 +8,25 @@ from pathlib import Path
 from typing import List, Tuple
 from typing import Optional
 
-from pysam import AlignmentFile
+from pysam import (
+    AlignmentFile,
+    CDEL,
+    CDIFF,
+    CEQUAL,
+    CINS,
+    CMATCH,
+    CREF_SKIP,
+    CSOFT_CLIP,
+)
 import pysam
 
 logger = logging.getLogger(__name__)
 
+# CIGAR operations that consume both query and reference (M, =, X)
+MATCH_OPS = frozenset([CMATCH, CEQUAL, CDIFF])
+# CIGAR operations that consume only the reference (D, N)
+DELETION_OPS = frozenset([CDEL, CREF_SKIP])
+
 
 @dataclass(frozen=True)
 class Read:
@@ -29,13 +43,15 @@ def read_bam(
     clone_id_end=None,
     require_umis=True,
     cell_id_tag="CB",
+    threads: int = 1,
 ):
     """
     bam_path -- path to input BAM file
     output_dir -- path to an output directory into which a BAM file is written that contais all
         reads on the chromosome that have the required tags.
+    threads -- number of threads htslib uses for decompressing the BAM file
     """
-    with AlignmentFile(bam_path) as alignment_file:
+    with AlignmentFile(bam_path, threads=threads) as alignment_file:
         if chr_name is None:
             chr_name = alignment_file.references[-1]
 
@@ -139,17 +155,18 @@ def read_alignment_file(
     return reads, no_umi, no_cell_id, reads_seq
 
 
-def write_outbam(all_reads_seq, output_bam_path, input_bam_path):
+def write_outbam(all_reads_seq, output_bam_path, input_bam_path, threads: int = 1):
     # Write the passing alignments to a separate file
-    alignment_file = AlignmentFile(input_bam_path, "rb")
-
     new_path = output_bam_path.with_name("temp.bam")
-    with AlignmentFile(new_path, "wb", template=alignment_file) as out_bam:
-        for read in all_reads_seq:
-            out_bam.write(read)
+    with AlignmentFile(input_bam_path, "rb") as alignment_file:
+        with AlignmentFile(
+            new_path, "wb", template=alignment_file, threads=threads
+        ) as out_bam:
+            for read in all_reads_seq:
+                out_bam.write(read)
 
     # Sort reads
-    pysam.sort("-o", str(output_bam_path), str(new_path), "--no-PG")
+    pysam.sort("-@", str(threads), "-o", str(output_bam_path), str(new_path), "--no-PG")
     new_path.unlink()
 
 
@@ -182,41 +199,70 @@ class CachedCloneIdExtractor:
         return clone_id
 
     def _extract(self, read):
-        query_align_end = read.query_alignment_end
-        query_align_start = read.query_alignment_start
+        cigar = read.cigartuples
+        if not cigar:
+            return None
         query_sequence = read.query_sequence
-        # Extract cloneID
+        # Extract cloneID. Instead of inspecting each aligned base, copy slices of
+        # the query sequence for each CIGAR operation that overlaps the cloneID.
         clone_id = ["-"] * (self._end - self._start)
         bases = 0
-        for query_pos, ref_pos in read.get_aligned_pairs():
-            # Replace soft-clipping with an ungapped alignment extending into the
-            # soft-clipped region, assuming the clipping occurred because the cloneID
-            # region was encountered
-            if ref_pos is None:
-                # Soft clip or insertion
-                if query_align_end <= query_pos:
-                    # We are in a soft-clipped region at the 3' end of the read
-                    ref_pos = read.reference_end + (query_pos - query_align_end)
-                elif query_align_start > query_pos:
-                    # We are in a soft-clipped region at the 5' end of the read
-                    ref_pos = read.reference_start - (query_align_start - query_pos)
-                # ref_pos remains None if this is an insertion
-
-            if ref_pos is not None and self._start <= ref_pos < self._end:
-                if query_pos is None:
-                    # Deletion or intron skip
-                    query_base = "0"
+        query_pos = 0
+        ref_pos = read.reference_start
+        aligned = False
+        for op, length in cigar:
+            if op in MATCH_OPS:
+                bases += self._copy(
+                    clone_id, query_sequence, query_pos, ref_pos, length
+                )
+                query_pos += length
+                ref_pos += length
+                aligned = True
+            elif op == CSOFT_CLIP:
+                # Replace soft-clipping with an ungapped alignment extending into the
+                # soft-clipped region, assuming the clipping occurred because the
+                # cloneID region was encountered
+                if aligned:
+                    # Soft-clipped region at the 3' end of the read
+                    clip_ref_pos = ref_pos
                 else:
-                    # Match or mismatch
-                    query_base = query_sequence[query_pos]
-                    bases += 1
-                clone_id[ref_pos - self._start] = query_base
+                    # Soft-clipped region at the 5' end of the read
+                    clip_ref_pos = ref_pos - length
+                bases += self._copy(
+                    clone_id, query_sequence, query_pos, clip_ref_pos, length
+                )
+                query_pos += length
+            elif op == CINS:
+                query_pos += length
+            elif op in DELETION_OPS:
+                # Deletion or intron skip
+                lo = max(ref_pos, self._start)
+                hi = min(ref_pos + length, self._end)
+                if lo < hi:
+                    clone_id[lo - self._start : hi - self._start] = "0" * (hi - lo)
+                ref_pos += length
+                aligned = True
 
         if bases == 0:
             return None
         else:
             return "".join(clone_id)
 
+    def _copy(self, clone_id, query_sequence, query_pos, ref_pos, length) -> int:
+        """
+        Copy the part of an ungapped segment of the read that overlaps the cloneID
+        into clone_id. Return the number of copied bases.
+        """
+        lo = max(ref_pos, self._start)
+        hi = min(ref_pos + length, self._end)
+        if lo >= hi:
+            return 0
+        query_start = query_pos + lo - ref_pos
+        clone_id[lo - self._start : hi - self._start] = query_sequence[
+            query_start : query_start + hi - lo
+        ]
+        return hi - lo
+
 
 def detect_clone_id_location(
     alignment_file: AlignmentFile, reference_name: str
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Dict, List
-from collections import defaultdict, OrderedDict, Counter
+from collections import OrderedDict, Counter
+from itertools import groupby
+from operator import attrgetter
 
 from .molecule import Molecule
 
@@ -18,23 +20,23 @@ def compute_cells(
     sorted_molecules: List[Molecule], minimum_clone_id_length: int
 ) -> List[Cell]:
     """
-    Group molecules by cell id
+    Group molecules by cell id. The molecules must be sorted by cell id.
     """
-    cell_id_groups = defaultdict(list)
-    for molecule in sorted_molecules:
-        clone_id = molecule.clone_id
-        pure_li = clone_id.strip("-")
-        # TODO may not work as intended (strip only removes prefixes and suffixes)
-        pure_bc0 = clone_id.strip("0")
-        if (
-            len(pure_li) >= minimum_clone_id_length
-            and len(pure_bc0) >= minimum_clone_id_length
-        ):
-            cell_id_groups[molecule.cell_id].append(molecule)
-
     cells = []
-    for cell_id, molecules in cell_id_groups.items():
-        clone_ids = [molecule.clone_id for molecule in molecules]
+    for cell_id, molecules in groupby(sorted_molecules, key=attrgetter("cell_id")):
+        clone_ids = []
+        for molecule in molecules:
+            clone_id = molecule.clone_id
+            pure_li = clone_id.strip("-")
+            # TODO may not work as intended (strip only removes prefixes and suffixes)
+            pure_bc0 = clone_id.strip("0")
+            if (
+                len(pure_li) >= minimum_clone_id_length
+                and len(pure_bc0) >= minimum_clone_id_length
+            ):
+                clone_ids.append(clone_id)
+        if not clone_ids:
+            continue
         counts = OrderedDict(
             sorted(Counter(clone_ids).most_common(), key=lambda x: x[0].count("-"))
         )
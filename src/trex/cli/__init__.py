@@ -204,6 +204,17 @@ def add_common_arguments(parser, smartseq: bool):
         "(text file with one cell ID per line) in the clone graph",
     )
 
+    parser.add_argument(
+        "--threads",
+        "-j",
+        type=int,
+        metavar="N",
+        default=4,
+        help="Number of threads to use for reading and writing BAM files and for "
+        "per-cell cloneID correction. "
+        "Default: %(default)s",
+    )
+
     if smartseq:
         help = (
             "Path to a united BAM file for all cells or path to a folder "
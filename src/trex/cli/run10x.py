@@ -1,12 +1,13 @@
 """
 Run on single cell 10X Chromium or spatial Visium data processed by Cell / Space Ranger software
 """
-import re
 import sys
 import logging
 import dataclasses
 from pathlib import Path
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Dict, Iterable, Optional, DefaultDict, Union
 
 import pandas as pd
@@ -26,6 +27,7 @@ from ..writers import (
     write_loom,
 )
 from ..clustering import cluster_sequences
+from ..hamming import make_is_similar
 from ..clone import CloneGraph
 from ..filters import is_low_complexity
 from ..molecule import Molecule, compute_molecules
@@ -110,6 +112,7 @@ def main(args):
             should_plot=args.plot,
             highlight_cell_ids=highlight_cell_ids,
             should_write_loom=args.loom,
+            threads=args.threads,
         )
     except (CellRangerError, TrexError) as e:
         raise CommandLineError(e)
@@ -186,12 +189,13 @@ def run_trex(
     should_plot: bool = False,
     highlight_cell_ids: Optional[List[str]] = None,
     should_write_loom: bool = False,
+    threads: int = 1,
 ):
     if sample_names is not None and len(sample_names) != len(set(sample_names)):
         raise TrexError("The sample names need to be unique")
 
     dataset_reader = DatasetReader(
-        output_dir, genome_name, chromosome, start, end, prefix
+        output_dir, genome_name, chromosome, start, end, prefix, threads
     )
     reads = dataset_reader.read_all(
         transcriptome_inputs, amplicon_inputs, sample_names, allowed_cell_ids
@@ -227,7 +231,7 @@ def run_trex(
 
     if correct_per_cell:
         corrected_molecules = correct_clone_ids_per_cell(
-            molecules, max_hamming, min_length
+            molecules, max_hamming, min_length, threads=threads
         )
     else:
         corrected_molecules = correct_clone_ids(molecules, max_hamming, min_length)
@@ -420,9 +424,10 @@ def correct_clone_ids(
     counts = Counter(clone_ids)
 
     # Cluster them by Hamming distance
+    unique_clone_ids = list(set(clone_ids))
     clusters = cluster_sequences(
-        list(set(clone_ids)),
-        is_similar=lambda s, t: is_similar(s, t, min_overlap, max_hamming),
+        unique_clone_ids,
+        is_similar=make_is_similar(unique_clone_ids, min_overlap, max_hamming),
         k=7,
     )
 
@@ -445,12 +450,29 @@ def correct_clone_ids(
     return new_molecules
 
 
+def _cluster_cell_clone_ids(
+    clone_ids: List[str], min_overlap: int, max_hamming: int
+) -> List[List[str]]:
+    """Cluster the cloneIDs of a single cell by Hamming distance"""
+    return cluster_sequences(
+        clone_ids,
+        is_similar=make_is_similar(clone_ids, min_overlap, max_hamming),
+        k=0,
+    )
+
+
 def correct_clone_ids_per_cell(
-    molecules: List[Molecule], max_hamming: int, min_overlap: int = 20
+    molecules: List[Molecule],
+    max_hamming: int,
+    min_overlap: int = 20,
+    threads: int = 1,
 ) -> List[Molecule]:
     """
     Attempt to correct sequencing errors in the CloneID sequences of all
     molecules looking for similar sequences in the same cell.
+
+    If threads is greater than 1, cells are clustered in that many
+    worker processes.
     """
     # Count all cloneIDs (including those with '-' and '0')
     counts = Counter(m.clone_id for m in molecules)
@@ -460,25 +482,35 @@ def correct_clone_ids_per_cell(
     for molecule in molecules:
         cells[molecule.cell_id].append(molecule)
 
-    # Iterate over cells
-    cell_correction_map = defaultdict(dict)
+    # Collect the cloneIDs of all cells in which there is something to correct
+    cell_clone_ids: Dict[str, List[str]] = dict()
     for cell_id, cell_molecules in cells.items():
-        cell_clone_ids = list(set(m.clone_id for m in cell_molecules))
+        clone_ids = list(set(m.clone_id for m in cell_molecules))
+        if len(clone_ids) >= 2:
+            cell_clone_ids[cell_id] = clone_ids
 
-        if len(cell_clone_ids) < 2:
-            continue
-        clusters = cluster_sequences(
-            cell_clone_ids,
-            is_similar=lambda s, t: is_similar(s, t, min_overlap, max_hamming),
-            k=0,
-        )
+    cluster_cell = partial(
+        _cluster_cell_clone_ids, min_overlap=min_overlap, max_hamming=max_hamming
+    )
+    if threads > 1:
+        with ProcessPoolExecutor(max_workers=threads) as executor:
+            cell_clusters = list(
+                executor.map(cluster_cell, cell_clone_ids.values(), chunksize=64)
+            )
+    else:
+        cell_clusters = [cluster_cell(ids) for ids in cell_clone_ids.values()]
+
+    # Iterate over cells
+    cell_correction_map = defaultdict(dict)
+    for cell_id, clusters in zip(cell_clone_ids, cell_clusters):
         for cluster in clusters:
             if len(cluster) < 2:
                 continue
 
             # Pick most frequent cloneID as representative
-            longest = max(len(re.sub("[0-]", "", x)) for x in cluster)
-            subcluster = [x for x in cluster if len(re.sub("[0-]", "", x)) == longest]
+            known_lengths = {x: len(x) - x.count("-") - x.count("0") for x in cluster}
+            longest = max(known_lengths.values())
+            subcluster = [x for x in cluster if known_lengths[x] == longest]
             representative = max(
                 subcluster, key=lambda clone_id: (counts[clone_id], clone_id)
             )
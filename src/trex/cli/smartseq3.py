@@ -91,6 +91,7 @@ def main(args):
             should_write_umi_matrix=args.umi_matrix,
             should_plot=args.plot,
             highlight_cell_ids=highlight_cell_ids,
+            threads=args.threads,
         )
     except TrexError as e:
         raise CommandLineError("%s", e)
@@ -134,12 +135,13 @@ def run_smartseq3(
     should_write_umi_matrix: bool = False,
     should_plot: bool = False,
     highlight_cell_ids: Optional[List[str]] = None,
+    threads: int = 1,
 ):
     if sample_names is not None and len(sample_names) != len(set(sample_names)):
         raise TrexError("The sample names need to be unique")
 
     dataset_reader = DatasetReader(
-        output_dir, genome_name, chromosome, start, end, prefix
+        output_dir, genome_name, chromosome, start, end, prefix, threads
     )
     reads = dataset_reader.read_all(
         transcriptome_inputs,
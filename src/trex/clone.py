@@ -19,7 +19,9 @@ class Clone:
     def __init__(self, cells: List[Cell]):
         self.cells = cells
         self.cell_ids = tuple(sorted(c.cell_id for c in cells))
-        self.counts: Counter = sum((Counter(c.counts) for c in cells), Counter())
+        self.counts: Counter = Counter()
+        for cell in cells:
+            self.counts.update(cell.counts)
         self.n = len(cells)
         self.cell_id = "M-" + min(self.cell_ids)
         self._hash = hash(self.cell_ids)
@@ -119,15 +121,15 @@ class CloneGraph:
     def write_clones(file, clones):
         print("clone_nr", "cell_id", sep="\t", file=file)
         for index, (clone_id, cells) in enumerate(sorted(clones), start=1):
-            cells = sorted(cells)
-            for cell in cells:
-                print(index, cell.cell_id, sep="\t", file=file)
+            file.write("".join(f"{index}\t{cell.cell_id}\n" for cell in sorted(cells)))
 
     @staticmethod
     def write_clone_sequences(file, clones):
         print("clone_nr", "clone_id", sep="\t", file=file)
-        for index, (clone_id, cells) in enumerate(sorted(clones), start=1):
-            print(index, clone_id, sep="\t", file=file)
+        file.writelines(
+            f"{index}\t{clone_id}\n"
+            for index, (clone_id, cells) in enumerate(sorted(clones), start=1)
+        )
 
     def clones(self) -> List[Tuple[str, List[Cell]]]:
         """
@@ -1,5 +1,6 @@
 from pathlib import Path
 from itertools import zip_longest
+from operator import attrgetter
 import logging
 from typing import Optional, List
 from dataclasses import replace
@@ -23,7 +24,14 @@ def find_paths(path, cell_id_tag):
 
 class DatasetReader:
     def __init__(
-        self, output_dir: Path, genome_name, chromosome, start, end, prefix: bool
+        self,
+        output_dir: Path,
+        genome_name,
+        chromosome,
+        start,
+        end,
+        prefix: bool,
+        threads: int = 1,
     ):
         self.output_dir = output_dir
         self.genome_name = genome_name
@@ -31,6 +39,7 @@ class DatasetReader:
         self.start = start
         self.end = end
         self.prefix = prefix
+        self.threads = threads
 
     def read_multiple(
         self, input_path, output_bam_path, cell_id_tag="CB", require_umis=True
@@ -54,6 +63,7 @@ class DatasetReader:
                 self.end,
                 require_umis,
                 cell_id_tag,
+                threads=self.threads,
             )
             all_reads.extend(reads)
             all_reads_seq.extend(reads_seq)
@@ -62,6 +72,7 @@ class DatasetReader:
             all_reads_seq=all_reads_seq,
             output_bam_path=output_bam_path,
             input_bam_path=input_bam_path,
+            threads=self.threads,
         )
 
         return all_reads
@@ -145,8 +156,9 @@ class DatasetReader:
             assert len(umis) > 0, "No UMIs"
         assert len(reads) > 0, "No reads"
 
-        sorted_reads = sorted(reads, key=lambda rd: (rd.cell_id, rd.clone_id))
-        return sorted_reads
+        # Sort in place; attrgetter builds the key tuples in C
+        reads.sort(key=attrgetter("cell_id", "clone_id"))
+        return reads
 
     def merge_datasets(self, datasets, names):
         if self.prefix:
@@ -0,0 +1,50 @@
+"""
+Hamming distance between cloneID sequences, compiled with Numba
+"""
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+from numba import njit
+
+# Characters that mark unknown positions in a cloneID
+GAP = ord("-")
+ZERO = ord("0")
+
+
+def encode(sequence: str) -> np.ndarray:
+    """Return the sequence as an array of ASCII codes"""
+    return np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+
+
+@njit(cache=True)
+def hamming_overlap(a, b):
+    """
+    Return a tuple (hamming, overlap) for two encoded sequences of equal length,
+    where overlap is the number of positions at which neither sequence
+    has a "-" or "0" and hamming is the number of mismatches among these.
+    """
+    hamming = 0
+    overlap = 0
+    for i in range(a.size):
+        if a[i] == GAP or a[i] == ZERO or b[i] == GAP or b[i] == ZERO:
+            continue
+        overlap += 1
+        hamming += a[i] != b[i]
+    return hamming, overlap
+
+
+def make_is_similar(
+    sequences: Iterable[str], min_overlap: int, max_hamming: int
+) -> Callable[[str, str], bool]:
+    """
+    Return a function is_similar(s, t) that behaves like
+    trex.cli.run10x.is_similar for the given sequences, which must all
+    have the same length. Each sequence is encoded only once.
+    """
+    encoded: Dict[str, np.ndarray] = {s: encode(s) for s in sequences}
+
+    def is_similar(s: str, t: str) -> bool:
+        hamming, overlap = hamming_overlap(encoded[s], encoded[t])
+        return overlap >= min_overlap and hamming <= max_hamming
+
+    return is_similar
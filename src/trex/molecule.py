@@ -4,10 +4,19 @@ A molecule is a DNA/RNA fragment that has potentially been sequenced multiple ti
 from dataclasses import dataclass
 from typing import List, Sequence
 from collections import defaultdict
+from operator import attrgetter
 import numpy as np
 
 from .bam import Read
 
+_LETTERS = np.array(["A", "C", "G", "T", "-", "0"])
+# Weight of each letter when computing the consensus: A base counts ten times as
+# much as a "-" or "0". Any other character is mapped to the last entry and does
+# not count.
+_WEIGHTS = np.array([10, 10, 10, 10, 1, 1, 0])
+_CHARACTER_CODES = np.full(256, len(_WEIGHTS) - 1, dtype=np.intp)
+_CHARACTER_CODES[np.frombuffer(b"ACGT-0", dtype=np.uint8)] = np.arange(len(_LETTERS))
+
 
 @dataclass
 class Molecule:
@@ -46,11 +55,9 @@ def compute_molecules(reads: List[Read]) -> List[Molecule]:
             )
         )
 
-    sorted_molecules = sorted(
-        molecules, key=lambda mol: (mol.cell_id, mol.clone_id, mol.umi)
-    )
+    molecules.sort(key=attrgetter("cell_id", "clone_id", "umi"))
 
-    return sorted_molecules
+    return molecules
 
 
 def compute_consensus(sequences: Sequence[str]) -> str:
@@ -66,28 +73,19 @@ def compute_consensus(sequences: Sequence[str]) -> str:
     # TODO
     # Ensure that the sequences are actually somewhat similar
 
-    letters = np.array(["A", "C", "G", "T", "-", "0"])
     length = len(sequences[0])
-    matrix = np.zeros([length, 6], dtype="float16")
-    for sequence in sequences:
-        align = np.zeros([length, 6], dtype="float16")
-        for i, ch in enumerate(sequence):
-            # turns each base into a number and position in numpy array
-            if ch == "A":
-                align[i, 0] = 1
-            elif ch == "C":
-                align[i, 1] = 1
-            elif ch == "G":
-                align[i, 2] = 1
-            elif ch == "T":
-                align[i, 3] = 1
-            elif ch == "-":
-                align[i, 4] = 0.1
-            elif ch == "0":
-                align[i, 5] = 0.1
-        matrix += align
+    # Translate characters to column indices, one row per sequence
+    codes = _CHARACTER_CODES[
+        np.frombuffer("".join(sequences).encode("ascii"), dtype=np.uint8)
+    ].reshape(-1, length)
+    # Count each character at each position and weight the counts
+    counts = np.bincount(
+        (codes + len(_WEIGHTS) * np.arange(length)).ravel(),
+        minlength=len(_WEIGHTS) * length,
+    ).reshape(length, len(_WEIGHTS))
+    matrix = counts * _WEIGHTS
 
     # calculate base with maximum count for each position
-    bin_consens = np.argmax(matrix, axis=1)
+    bin_consens = np.argmax(matrix[:, : len(_LETTERS)], axis=1)
     # convert maximum counts into consensus sequence
-    return "".join(letters[bin_consens])
+    return "".join(_LETTERS[bin_consens])
@@ -326,21 +326,12 @@ def jaccard_similarity_matrix(umi_count: pd.DataFrame) -> npt.ArrayLike:
     Note: columns are cell IDs and first column is disregarded as it usually has
     the index to cloneIDs
     """
-    this_cell_ids = umi_count.columns[1:]
-    jaccard_matrix = np.zeros([len(this_cell_ids)] * 2)
-    bool_umi = pd.DataFrame(
-        umi_count.values > 0, columns=umi_count.columns, index=umi_count.index
-    )
-    cell_id_position_dict = {
-        this_cell_id: i for i, this_cell_id in enumerate(this_cell_ids)
-    }
-
-    for id1, id2 in combinations(this_cell_ids, 2):
-        clones_cell_1 = bool_umi[id1].values
-        clones_cell_2 = bool_umi[id2].values
-        jaccard_matrix[
-            cell_id_position_dict[id1], cell_id_position_dict[id2]
-        ] = jaccard(clones_cell_1, clones_cell_2)
+    bool_umi = umi_count.values[:, 1:] > 0
+    n_cells = bool_umi.shape[1]
+    jaccard_matrix = np.zeros([n_cells] * 2)
+
+    for i, j in combinations(range(n_cells), 2):
+        jaccard_matrix[i, j] = jaccard(bool_umi[:, i], bool_umi[:, j])
 
     jaccard_matrix = jaccard_matrix + jaccard_matrix.T
     jaccard_matrix[np.diag_indices_from(jaccard_matrix)] = 1
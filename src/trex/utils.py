@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List
 
 import pandas as pd
@@ -31,11 +32,9 @@ def dataframe_to_molecule_list(df: pd.DataFrame) -> List[Molecule]:
         for r, mol in df.iterrows()
     ]
 
-    sorted_molecules = sorted(
-        molecules, key=lambda mol: (mol.cell_id, mol.clone_id, mol.umi)
-    )
+    molecules.sort(key=attrgetter("cell_id", "clone_id", "umi"))
 
-    return sorted_molecules
+    return molecules
 
 
 def dataframe_to_cell_list(df: pd.DataFrame) -> List[Cell]:
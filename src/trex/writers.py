@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import List, Set, Any
+from typing import List, Set
 from .cell import Cell
-import operator
+from operator import attrgetter, itemgetter
 import warnings
 
 with warnings.catch_warnings():
@@ -22,11 +22,8 @@ def write_count_matrix(path: Path, cells: List[Cell]):
         f.write(",".join(cell.cell_id for cell in cells))
         f.write("\n")
         for clone_id in clone_ids:
-            f.write(clone_id)
-            f.write(",")
-            values = [lic.get(clone_id, 0) for lic in all_counts]
-            f.write(",".join(str(v) for v in values))
-            f.write("\n")
+            values = ",".join(str(lic.get(clone_id, 0)) for lic in all_counts)
+            f.write(f"{clone_id},{values}\n")
 
 
 def write_cells(path: Path, cells: List[Cell]) -> None:
@@ -44,15 +41,15 @@ def write_cells(path: Path, cells: List[Cell]) -> None:
             file=f,
         )
         for cell in cells:
-            row: List[Any] = [cell.cell_id, ":"]
             sorted_clone_ids = sorted(
                 cell.counts, key=lambda x: cell.counts[x], reverse=True
             )
             if not sorted_clone_ids:
                 continue
-            for clone_id in sorted_clone_ids:
-                row.extend([clone_id, cell.counts[clone_id]])
-            print(*row, sep="\t", file=f)
+            counts = "\t".join(
+                f"{clone_id}\t{cell.counts[clone_id]}" for clone_id in sorted_clone_ids
+            )
+            f.write(f"{cell.cell_id}\t:\t{counts}\n")
 
 
 def write_reads_or_molecules(path, mols_or_reads, require_umis=True, sort=True):
@@ -60,31 +57,17 @@ def write_reads_or_molecules(path, mols_or_reads, require_umis=True, sort=True):
         if require_umis:
             if sort:
                 mols_or_reads = sorted(
-                    mols_or_reads,
-                    key=lambda mol_or_read: (
-                        mol_or_read.umi,
-                        mol_or_read.cell_id,
-                        mol_or_read.clone_id,
-                    ),
+                    mols_or_reads, key=attrgetter("umi", "cell_id", "clone_id")
                 )
             print("#cell_id", "umi", "clone_id", sep="\t", file=f)
-            for mol_or_read in mols_or_reads:
-                print(
-                    mol_or_read.cell_id,
-                    mol_or_read.umi,
-                    mol_or_read.clone_id,
-                    sep="\t",
-                    file=f,
-                )
+            f.writelines(f"{m.cell_id}\t{m.umi}\t{m.clone_id}\n" for m in mols_or_reads)
         else:
             if sort:
                 mols_or_reads = sorted(
-                    mols_or_reads,
-                    key=lambda mol_or_read: (mol_or_read.clone_id, mol_or_read.cell_id),
+                    mols_or_reads, key=attrgetter("clone_id", "cell_id")
                 )
             print("#cell_id", "clone_id", sep="\t", file=f)
-            for mol_or_read in mols_or_reads:
-                print(mol_or_read.cell_id, mol_or_read.clone_id, sep="\t", file=f)
+            f.writelines(f"{m.cell_id}\t{m.clone_id}\n" for m in mols_or_reads)
 
 
 def write_loom(cells: List[Cell], cellranger, output_dir, clone_id_length, top_n=6):
@@ -98,7 +81,7 @@ def write_loom(cells: List[Cell], cellranger, output_dir, clone_id_length, top_n
     for cell in cells:
         if not cell.counts:
             continue
-        counts = sorted(cell.counts.items(), key=operator.itemgetter(1))
+        counts = sorted(cell.counts.items(), key=itemgetter(1))
         counts.reverse()
         counts = counts[:top_n]
         most_abundant[cell.cell_id] = counts
@@ -1,4 +1,5 @@
 from trex.cli.run10x import is_similar, is_similar_to_any
+from trex.hamming import make_is_similar
 
 import pytest
 
@@ -50,6 +51,10 @@ def test_is_similar(s, t, similar):
     assert is_similar(s.replace("-", "0"), t, min_overlap, max_hamming) == similar
     assert is_similar(s, t.replace("-", "0"), min_overlap, max_hamming) == similar
 
+    fast_is_similar = make_is_similar([s, t], min_overlap, max_hamming)
+    assert fast_is_similar(s, t) == similar
+    assert fast_is_similar(t, s) == similar
+
 
 @pytest.mark.parametrize(
     "s,strings,similar",
@@ -3,6 +3,8 @@ import subprocess
 from pathlib import Path
 from shutil import copytree
 
+import pytest
+
 from trex.cli import add_file_logging
 from trex.cli.qc import make_qc_report
 from trex.cli.run10x import run_trex, read_excluded_clone_ids
@@ -52,7 +54,8 @@ def test_run_trex(tmp_path):
     bam_diff("tests/expected/entries.bam", tmp_path / "entries.bam", tmp_path)
 
 
-def test_run_trex_per_cell(tmp_path):
+@pytest.mark.parametrize("threads", [1, 2])
+def test_run_trex_per_cell(tmp_path, threads):
     # Ensure --per-cell works
     add_file_logging(tmp_path / "log.txt")
     logger = logging.getLogger()
@@ -65,6 +68,7 @@ def test_run_trex_per_cell(tmp_path):
         start=694,
         end=724,
         correct_per_cell=True,
+        threads=threads,
     )
     diff("tests/expected_per_cell/log.txt", tmp_path / "log.txt")
 